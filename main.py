@@ -7,25 +7,46 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import threading
 import time
-from PIL import Image, ImageTk, ImageGrab
+import atexit
+import concurrent.futures
+from PIL import Image, ImageTk, ImageDraw, ImageFont
 import win32api
 import win32con
+import win32event
 import win32gui
-from screeninfo import get_monitors
-import keyboard
+import winerror
+import pywintypes
+import ctypes
 
 import winreg
 import configparser
 import os
+import re
+from datetime import datetime
 import sys
 
+# 时间输入格式 HH:MM:SS，输入过程中允许不完整的内容
+TIME_PATTERN = re.compile(r'^(\d{1,2}):(\d{1,2}):(\d{1,2})$')
+TIME_INPUT_PATTERN = re.compile(r'^\d{0,2}(:\d{0,2}){0,2}$')
+
+# 主窗口标题，已有实例运行时按此标题查找窗口
+WINDOW_TITLE = "老绅控屏眼 - 多屏幕控制"
+
+# 预览尺寸：截图时直接缩放到此大小，与预览窗口一致，显示时无需再缩放
+PREVIEW_WIDTH, PREVIEW_HEIGHT = 300, 200
+
+# 批量修改显示设置：先写入注册表暂不应用，最后统一应用
+DISPLAY_BATCH_FLAGS = win32con.CDS_UPDATEREGISTRY | win32con.CDS_NORESET
+
 class ToolTip:
     """工具提示类"""
-    def __init__(self, widget, text):
+    def __init__(self, widget, text, font=None):
         self.widget = widget
         self.text = text
+        self.font = font
         self.tooltip = None
         self.widget.bind("<Enter>", self.on_enter)
         self.widget.bind("<Leave>", self.on_leave)
@@ -44,7 +65,7 @@ class ToolTip:
         
         label = tk.Label(self.tooltip, text=self.text, 
                         background="#ffffe0", relief="solid", borderwidth=1,
-                        font=("./29华康宋体W3.ttf", 9))
+                        font=self.font)
         label.pack()
     
     def on_leave(self, event=None):
@@ -54,12 +75,29 @@ class ToolTip:
             self.tooltip = None
 
 class ScreenController:
+    # 错误提示预览使用的字体和背景，首次使用时创建并在所有调用间共享
+    error_font = None
+    error_background = None
+    
     def __init__(self):
         self.root = tk.Tk()
-        self.root.title("老绅控屏眼 - 多屏幕控制")
+        self.root.title(WINDOW_TITLE)
         self.root.geometry("800x450")
         self.root.resizable(True, True)
         
+        # 界面字体只创建一次，所有控件共享
+        font_family = "./29华康宋体W3.ttf"
+        self.font_sm = tkfont.Font(root=self.root, family=font_family, size=8)
+        self.font_md = tkfont.Font(root=self.root, family=font_family, size=9)
+        self.font_lg = tkfont.Font(root=self.root, family=font_family, size=10)
+        self.font_xl = tkfont.Font(root=self.root, family=font_family, size=12)
+        self.font_bold = tkfont.Font(root=self.root, family=font_family, size=9, weight="bold")
+        self.font_lg_bold = tkfont.Font(root=self.root, family=font_family, size=10, weight="bold")
+        self.font_title = tkfont.Font(root=self.root, family=font_family, size=12, weight="bold")
+        
+        # 按钮样式
+        self.setup_styles()
+        
         # 配置文件路径 - 使用程序所在目录确保EXE兼容性
         if getattr(sys, 'frozen', False):
             # 如果是打包的exe文件
@@ -70,54 +108,147 @@ class ScreenController:
         self.config_file = os.path.join(app_dir, "screen_config.ini")
         self.config = configparser.ConfigParser()
         
-        # 获取屏幕信息
-        self.monitors = self.get_screen_info()
+        # 每个屏幕独立的截图资源，用于并行截取屏幕预览
+        self.capture_surfaces = {}
+        
+        # 熄屏前的显示设置（用于恢复）、已熄屏的显示设备及熄屏时显示的黑色预览
+        self.original_settings = {}
+        self.monitor_off = {}
+        self.black_preview = Image.new('RGB', (PREVIEW_WIDTH, PREVIEW_HEIGHT), 'black')
+        
+        # 截图线程池完成、尚未显示的预览帧（每个屏幕只保留最新一帧）
+        self.preview_frames = {}
+        self.preview_frames_lock = threading.Lock()
+        
+        # EDID显示器名称缓存（只在刷新屏幕信息时重新读取注册表）
+        self.edid_cache = None
         
-        # 加载配置
+        # 显示设备名称及显示设置缓存（显示器配置变化时清空）
+        self.device_name_cache = {}
+        self.display_settings_cache = {}
+        self.screen_info_cache = None
+        
+        # 加载配置（获取显示器名称时需要用到其中的设置）
         self.load_config()
         
+        # 获取屏幕信息
+        self.monitors = self.cached_screen_info()
+        
+        # 待保存的配置节及延迟保存定时器（连续修改只写一次文件）
+        self.config_dirty = set()
+        self.config_flush_id = None
+        
         # 创建界面
         self.create_widgets()
         
-        # 启动预览更新线程
-        self.preview_running = True
-        self.preview_thread = threading.Thread(target=self.update_previews, daemon=True)
-        self.preview_thread.start()
+        # 窗口最小化时暂停预览截图
+        self.ui_visible = True
+        self.root.bind("<Unmap>", self.on_root_unmap)
+        self.root.bind("<Map>", self.on_root_map)
+        
+        # 显示设置变化通知：等待模式切换完成，并在切换后刷新屏幕信息
+        self.display_changed = threading.Event()
+        self.display_change_pending = threading.Event()
+        self.display_refresh_id = None
+        # 快捷键线程收到的重置请求
+        self.hotkey_reset_pending = threading.Event()
         
-        # 启动自动熄屏检测定时器
-        self.auto_screen_timer_running = True
-        self.start_auto_screen_timer()
+        # 启动预览更新
+        self.start_previews()
+        self.preview_drain_id = self.root.after(self.preview_drain_interval, self.drain_preview_frames)
         
-        # 注册全局快捷键
+        # 注册全局快捷键并监听显示设置变化，由主线程定时处理收到的通知
         self.setup_global_hotkeys()
+        self.message_poll_id = self.root.after(100, self.poll_thread_messages)
+    
+    def setup_styles(self):
+        """注册按钮样式，按用途共享配色和字体"""
+        style = ttk.Style(self.root)
+        # Windows默认主题不支持自定义按钮背景色，使用clam主题
+        style.theme_use('clam')
+        
+        button_colors = {
+            'Danger.TButton': "#ff6b6b",
+            'Warning.TButton': "#fd7e14",
+            'Primary.TButton': "#339af0",
+            'Exit.TButton': "#e03131"
+        }
+        for style_name, color in button_colors.items():
+            style.configure(style_name, foreground="white", background=color, font=self.font_bold)
+            style.map(style_name, background=[('active', color)], foreground=[('active', "white")])
+        
+        # 底部控制区域使用较大字体
+        style.configure('Large.Warning.TButton', font=self.font_lg_bold)
+        style.configure('Primary.TButton', font=self.font_lg_bold)
+        style.configure('Exit.TButton', font=self.font_lg_bold)
     
     def load_config(self):
         """加载配置文件"""
+        # 默认设置
+        self.detection_interval = 5
+        self.preview_fps = 1.0
+        self.preview_quality = 'smooth'
+        self.verify_monitor_power = False
+        self.allow_wmi = False
+        
         if os.path.exists(self.config_file):
             try:
                 self.config.read(self.config_file, encoding='utf-8')
-                # 加载检测间隔设置
+                # 加载检测间隔及预览设置，全部解析成功后才替换默认设置
                 if self.config.has_section('SETTINGS'):
-                    self.detection_interval = self.config.getint('SETTINGS', 'detection_interval', fallback=5)
-                else:
-                    self.detection_interval = 5
+                    settings = self.config['SETTINGS']
+                    detection_interval = settings.getint('detection_interval', fallback=self.detection_interval)
+                    preview_fps = settings.getfloat('preview_fps', fallback=self.preview_fps)
+                    preview_quality = settings.get('preview_quality', fallback=self.preview_quality)
+                    # 是否在熄屏记录之外再查询显示设置确认显示器状态
+                    verify_monitor_power = settings.getboolean('verify_monitor_power', fallback=self.verify_monitor_power)
+                    # EDID和显示设备API都取不到名称时，是否通过WMI（较慢）获取显示器名称
+                    allow_wmi = settings.getboolean('allow_wmi', fallback=self.allow_wmi)
+                    
+                    self.detection_interval = detection_interval
+                    self.preview_fps = preview_fps
+                    self.preview_quality = preview_quality
+                    self.verify_monitor_power = verify_monitor_power
+                    self.allow_wmi = allow_wmi
             except Exception:
-                self.detection_interval = 5
+                pass
+        
+        # 检测间隔至少1秒，避免自动熄屏检测占满主线程
+        self.detection_interval = max(1, self.detection_interval)
+        
+        # 预览帧率限制在合理范围内
+        if self.preview_fps <= 0:
+            self.preview_fps = 1.0
+        self.preview_fps = min(self.preview_fps, 30.0)
+        # 预览显示间隔跟随帧率，高帧率时不会丢弃尚未显示的预览帧，最长100毫秒
+        self.preview_drain_interval = min(100, int(1000 / self.preview_fps))
+        
+        # 预览缩放质量：smooth为平滑缩放（HALFTONE），fast为快速缩放（COLORONCOLOR）
+        if self.preview_quality == 'fast':
+            self.preview_stretch_mode = win32con.COLORONCOLOR
         else:
-            self.detection_interval = 5
+            self.preview_stretch_mode = win32con.HALFTONE
     
-    def save_config(self):
-        """保存配置文件"""
+    def write_config_atomic(self):
+        """保存配置文件（先写入临时文件再替换，避免写入中断导致配置损坏）"""
+        temp_file = self.config_file + '.tmp'
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 self.config.write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, self.config_file)
         except Exception:
-            pass
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
     
-    def save_detection_interval(self):
-        """保存检测间隔设置"""
+    def update_detection_interval(self):
+        """更新检测间隔设置（只修改内存中的配置）"""
         try:
-            interval = int(self.detection_interval_var.get())
+            # 输入框可以直接输入数值，检测间隔至少1秒
+            interval = max(1, int(self.detection_interval_var.get()))
             self.detection_interval = interval
             
             # 确保SETTINGS节存在
@@ -126,13 +257,39 @@ class ScreenController:
             
             # 保存检测间隔
             self.config.set('SETTINGS', 'detection_interval', str(interval))
-            
-            # 保存到文件
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
         except Exception:
             pass
     
+    def mark_config_dirty(self, key):
+        """标记需要保存的配置（屏幕区域标识或SETTINGS），最后一次修改300毫秒后统一写入文件"""
+        self.config_dirty.add(key)
+        if self.config_flush_id:
+            self.root.after_cancel(self.config_flush_id)
+        self.config_flush_id = self.root.after(300, self.flush_config_dirty)
+    
+    def flush_config_dirty(self):
+        """将所有待保存的配置节更新到配置中，并只写入一次文件"""
+        self.config_flush_id = None
+        dirty_keys = self.config_dirty
+        self.config_dirty = set()
+        
+        for key in dirty_keys:
+            if key == 'SETTINGS':
+                self.update_detection_interval()
+            else:
+                self.update_time_config(key)
+        
+        if dirty_keys:
+            self.write_config_atomic()
+    
+    def get_monitor_slot_key(self, monitor):
+        """获取屏幕区域的标识
+        
+        配置键只包含名称和分辨率，两台相同型号的显示器会得到相同的配置键，
+        因此屏幕区域还要加上屏幕编号区分；配置键变化时屏幕区域重新创建
+        """
+        return monitor['id'], self.get_monitor_config_key(monitor)
+    
     def get_monitor_config_key(self, monitor):
         """获取显示器的配置键名"""
         # 使用显示器名称和分辨率作为唯一标识
@@ -140,6 +297,11 @@ class ScreenController:
     
     def save_monitor_config(self, monitor, auto_enabled, start_time, end_time):
         """保存显示器配置"""
+        self.update_monitor_config(monitor, auto_enabled, start_time, end_time)
+        self.write_config_atomic()
+    
+    def update_monitor_config(self, monitor, auto_enabled, start_time, end_time):
+        """更新显示器配置（只修改内存中的配置）"""
         key = self.get_monitor_config_key(monitor)
         if key not in self.config:
             self.config.add_section(key)
@@ -149,26 +311,55 @@ class ScreenController:
         self.config[key]['end_time'] = end_time
         self.config[key]['monitor_name'] = monitor['name']
         self.config[key]['resolution'] = f"{monitor['width']}x{monitor['height']}"
-        
-        self.save_config()
     
-    def save_time_config(self, monitor):
-        """保存时间配置变化"""
+    def update_time_config(self, slot_key):
+        """更新时间配置变化（只修改内存中的配置）"""
         try:
             # 找到对应的widget信息
-            widget_info = None
-            for widget in self.preview_widgets:
-                if widget['monitor'] == monitor:
-                    widget_info = widget
-                    break
+            widget_info = self.widget_by_slot.get(slot_key)
             
             if widget_info:
-                start_time = f"{widget_info['start_hour_var'].get()}:{widget_info['start_min_var'].get()}:{widget_info['start_sec_var'].get()}"
-                end_time = f"{widget_info['end_hour_var'].get()}:{widget_info['end_min_var'].get()}:{widget_info['end_sec_var'].get()}"
-                self.save_monitor_config(monitor, widget_info['auto_enabled'], start_time, end_time)
+                start_time = widget_info['start_time_var'].get()
+                end_time = widget_info['end_time_var'].get()
+                # 输入未完成时不保存
+                if self.parse_time_seconds(start_time) is None or self.parse_time_seconds(end_time) is None:
+                    return
+                self.update_monitor_config(widget_info['monitor'], widget_info['auto_enabled'], start_time, end_time)
         except Exception:
             pass
     
+    def parse_time_seconds(self, text):
+        """将HH:MM:SS格式的时间解析为当天的秒数，格式无效时返回None"""
+        match = TIME_PATTERN.match(text.strip())
+        if not match:
+            return None
+        hour, minute, second = (int(part) for part in match.groups())
+        if hour > 23 or minute > 59 or second > 59:
+            return None
+        return hour * 3600 + minute * 60 + second
+    
+    def format_time_text(self, text):
+        """将时间规范为HH:MM:SS格式，格式无效时原样返回"""
+        total_sec = self.parse_time_seconds(text)
+        if total_sec is None:
+            return text
+        return f"{total_sec // 3600:02d}:{total_sec % 3600 // 60:02d}:{total_sec % 60:02d}"
+    
+    def validate_time_input(self, text):
+        """时间输入框的按键校验，只允许数字和冒号"""
+        return TIME_INPUT_PATTERN.match(text) is not None
+    
+    def normalize_time_input(self, widget_info, field):
+        """规范时间输入框的格式，无效输入恢复为已保存的时间"""
+        time_var = widget_info[f'{field}_var']
+        if self.parse_time_seconds(time_var.get()) is None:
+            saved_time = self.load_monitor_config(widget_info['monitor'])[field]
+            time_var.set(self.format_time_text(saved_time))
+        else:
+            formatted = self.format_time_text(time_var.get())
+            if formatted != time_var.get():
+                time_var.set(formatted)
+    
     def load_monitor_config(self, monitor):
         """加载显示器配置"""
         key = self.get_monitor_config_key(monitor)
@@ -190,6 +381,7 @@ class ScreenController:
     def get_screen_info(self):
         """获取所有屏幕信息"""
         try:
+            from screeninfo import get_monitors
             monitors = get_monitors()
             screen_info = []
             
@@ -209,7 +401,9 @@ class ScreenController:
                     'height': monitor.height,
                     'x': monitor.x,
                     'y': monitor.y,
-                    'is_primary': monitor.is_primary
+                    'is_primary': monitor.is_primary,
+                    # 截图源区域（虚拟屏幕坐标），屏幕配置变化时随刷新重新计算
+                    'capture_rect': (monitor.x, monitor.y, monitor.width, monitor.height)
                 }
                 screen_info.append(info)
             return screen_info
@@ -217,8 +411,26 @@ class ScreenController:
             messagebox.showerror("错误", f"获取屏幕信息失败: {str(e)}")
             return []
     
+    def cached_screen_info(self, ttl=0.5):
+        """获取所有屏幕信息，短时间内重复查询时使用缓存"""
+        now = time.monotonic()
+        if self.screen_info_cache and now - self.screen_info_cache[0] < ttl:
+            return self.screen_info_cache[1]
+        screen_info = self.get_screen_info()
+        # 获取失败时不缓存，下次查询重新获取
+        self.screen_info_cache = (now, screen_info) if screen_info else None
+        return screen_info
+    
+    def invalidate_screen_info(self):
+        """显示设置变化后清空屏幕信息缓存"""
+        self.screen_info_cache = None
+    
     def get_monitor_name_from_edid(self):
         """从注册表EDID信息中获取真实的显示器名称"""
+        # EDID只在硬件插拔时变化，优先使用缓存
+        if self.edid_cache is not None:
+            return self.edid_cache
+        
         monitor_names = []
         try:
             # 打开显示器注册表项
@@ -274,6 +486,7 @@ class ScreenController:
         except Exception:
             pass  # 注册表查询失败
         
+        self.edid_cache = monitor_names
         return monitor_names
     
     def parse_edid_monitor_name(self, edid_data):
@@ -282,17 +495,16 @@ class ScreenController:
             if len(edid_data) < 128:
                 return None
             
-            # EDID中的显示器名称通常在字节54-125的描述符块中
-            for i in range(54, 126, 18):  # 每个描述符块18字节
-                if i + 17 < len(edid_data):
-                    # 检查是否是显示器名称描述符 (类型 0xFC)
-                    if edid_data[i + 3] == 0xFC:
-                        # 提取名称 (从第5字节开始，最多13字节)
-                        name_bytes = edid_data[i + 5:i + 18]
-                        # 移除填充字符和空字符
-                        name = name_bytes.rstrip(b'\x00\x0A\x20').decode('ascii', errors='ignore')
-                        if name.strip():
-                            return name.strip()
+            edid_view = memoryview(edid_data)
+            
+            # EDID中的显示器名称通常在字节54-125的4个描述符块中（每块18字节）
+            for i in (54, 72, 90, 108):
+                # 检查是否是显示器名称描述符 (类型 0xFC)
+                if edid_view[i + 3] == 0xFC:
+                    # 提取名称 (从第5字节开始，最多13字节，以换行符结束，其后为空格填充)
+                    name = bytes(edid_view[i + 5:i + 18]).split(b'\x0A', 1)[0].strip(b'\x00\x20').decode('ascii', errors='ignore')
+                    if name:
+                        return name
             
             return None
         except Exception:
@@ -303,32 +515,21 @@ class ScreenController:
         devices = []
         try:
             # 首先尝试从注册表EDID获取真实的显示器名称
-            monitor_devices = self.get_monitor_name_from_edid()
+            monitor_devices = list(self.get_monitor_name_from_edid())
             
-            # 如果EDID方法没有获取到足够的显示器，尝试使用WMI
+            # 如果EDID方法没有获取到显示器，使用EnumDisplayDevices
             if not monitor_devices:
-                try:
-                    import wmi
-                    c = wmi.WMI()
-                    
-                    # 首先尝试Win32_DesktopMonitor
-                    try:
-                        desktop_monitors = c.Win32_DesktopMonitor()
-                        
-                        for monitor in desktop_monitors:
-                            if monitor.Name and monitor.Name.strip():
-                                monitor_name = monitor.Name.strip()
-                                # 过滤掉通用名称
-                                if not any(generic in monitor_name.lower() for generic in ["default", "generic", "pnp", "plug and play", "默认", "通用", "即插即用"]):
-                                    monitor_devices.append(monitor_name)
-                    except Exception:
-                        pass  # Win32_DesktopMonitor 查询失败
-                        
-                except ImportError:
-                    pass  # WMI模块不可用
+                devices = self.get_display_devices_from_api()
+                
+                # EnumDisplayDevices也没有获取到有效名称时，最后才尝试WMI（初始化COM较慢，默认关闭）
+                has_real_name = any(device['name'] != f"显示器 {i + 1}" for i, device in enumerate(devices))
+                if not has_real_name and self.allow_wmi:
+                    monitor_devices = self.get_monitor_names_from_wmi()
+                    if monitor_devices:
+                        devices = []
             
             # 如果还是没有获取到有效的显示器名称，使用screeninfo生成默认名称
-            if not monitor_devices:
+            if not monitor_devices and not devices:
                 from screeninfo import get_monitors
                 monitors = get_monitors()
                 monitor_devices = [f"显示器 {i + 1}" for i in range(len(monitors))]
@@ -341,53 +542,114 @@ class ScreenController:
                     'device_id': ''
                 })
                     
-        except ImportError:
-                # 如果没有wmi模块，使用原来的方法
-                i = 0
-                while True:
-                    try:
-                        # 获取显示适配器信息
-                        adapter = win32api.EnumDisplayDevices(None, i)
-                        if adapter:
-                            # 尝试获取连接到此适配器的显示器
-                            monitor_name = f"显示器 {i + 1}"
-                            
-                            # 尝试枚举连接到此适配器的显示器
-                            try:
-                                monitor = win32api.EnumDisplayDevices(adapter.DeviceName, 0)
-                                if monitor and monitor.DeviceString:
-                                    # 清理显示器名称，移除不必要的前缀
-                                    monitor_name = monitor.DeviceString
-                                    # 移除常见的前缀
-                                    prefixes_to_remove = ["Generic PnP Monitor", "即插即用监视器"]
-                                    for prefix in prefixes_to_remove:
-                                        if monitor_name.startswith(prefix):
-                                            monitor_name = f"显示器 {i + 1}"
-                                            break
-                                    
-                                    # 如果名称太长，截取合理长度
-                                    if len(monitor_name) > 30:
-                                        monitor_name = monitor_name[:27] + "..."
-                            except:
-                                pass
-                            
-                            devices.append({
-                                'name': monitor_name,
-                                'device_key': adapter.DeviceKey if hasattr(adapter, 'DeviceKey') else '',
-                                'device_id': adapter.DeviceID if hasattr(adapter, 'DeviceID') else ''
-                            })
-                            i += 1
-                        else:
-                            break
-                    except:
-                        break
         except Exception as e:
             print(f"获取显示设备失败: {e}")
         
         return devices
+    
+    def get_display_devices_from_api(self):
+        """通过EnumDisplayDevices获取显示设备信息"""
+        devices = []
+        i = 0
+        while True:
+            try:
+                # 获取显示适配器信息
+                adapter = win32api.EnumDisplayDevices(None, i)
+                if not adapter:
+                    break
+                i += 1
+                
+                # 只保留已连接到桌面的适配器，与screeninfo检测到的屏幕一一对应
+                if not adapter.StateFlags & win32con.DISPLAY_DEVICE_ATTACHED_TO_DESKTOP:
+                    continue
+                
+                # 尝试获取连接到此适配器的显示器
+                monitor_name = f"显示器 {len(devices) + 1}"
+                
+                # 尝试枚举连接到此适配器的显示器
+                try:
+                    monitor = win32api.EnumDisplayDevices(adapter.DeviceName, 0)
+                    if monitor and monitor.DeviceString:
+                        # 清理显示器名称，移除不必要的前缀
+                        monitor_name = monitor.DeviceString
+                        # 移除常见的前缀
+                        prefixes_to_remove = ["Generic PnP Monitor", "即插即用监视器"]
+                        for prefix in prefixes_to_remove:
+                            if monitor_name.startswith(prefix):
+                                monitor_name = f"显示器 {len(devices) + 1}"
+                                break
+                        
+                        # 如果名称太长，截取合理长度
+                        if len(monitor_name) > 30:
+                            monitor_name = monitor_name[:27] + "..."
+                except:
+                    pass
+                
+                devices.append({
+                    'name': monitor_name,
+                    'device_key': adapter.DeviceKey if hasattr(adapter, 'DeviceKey') else '',
+                    'device_id': adapter.DeviceID if hasattr(adapter, 'DeviceID') else ''
+                })
+            except:
+                break
+        
+        return devices
+    
+    def get_monitor_names_from_wmi(self):
+        """通过WMI获取显示器名称"""
+        monitor_names = []
+        try:
+            import wmi
+            c = wmi.WMI()
+            
+            # 尝试Win32_DesktopMonitor
+            try:
+                desktop_monitors = c.Win32_DesktopMonitor()
+                
+                for monitor in desktop_monitors:
+                    if monitor.Name and monitor.Name.strip():
+                        monitor_name = monitor.Name.strip()
+                        # 过滤掉通用名称
+                        if not any(generic in monitor_name.lower() for generic in ["default", "generic", "pnp", "plug and play", "默认", "通用", "即插即用"]):
+                            monitor_names.append(monitor_name)
+            except Exception:
+                pass  # Win32_DesktopMonitor 查询失败
+                
+        except ImportError:
+            pass  # WMI模块不可用
+        except Exception:
+            pass  # WMI初始化失败
+        
+        return monitor_names
 
     def get_device_name_by_monitor(self, monitor):
-        """根据显示器信息获取设备名称"""
+        """根据显示器信息获取设备名称（结果缓存到显示器配置变化为止）"""
+        cache_key = (monitor['name'], monitor['x'], monitor['y'])
+        device_name = self.device_name_cache.get(cache_key)
+        if device_name is None:
+            device_name = self.find_device_name_by_monitor(monitor)
+            if device_name:
+                self.device_name_cache[cache_key] = device_name
+        return device_name
+    
+    def get_current_display_settings(self, device_name, ttl=2.0):
+        """获取设备的当前显示设置，短时间内重复查询时使用缓存"""
+        now = time.monotonic()
+        cached = self.display_settings_cache.get(device_name)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
+        self.display_settings_cache[device_name] = (now, settings)
+        return settings
+    
+    def invalidate_display_caches(self):
+        """显示器配置变化后清空设备名称、显示设置和屏幕信息缓存"""
+        self.device_name_cache.clear()
+        self.display_settings_cache.clear()
+        self.invalidate_screen_info()
+    
+    def find_device_name_by_monitor(self, monitor):
+        """枚举显示设备，查找与显示器位置和尺寸匹配的设备名称"""
         try:
             # 枚举所有显示设备
             device_index = 0
@@ -418,7 +680,7 @@ class ScreenController:
                                 return device.DeviceName
                         except Exception as e2:
                             # 如果都失败了，检查是否有保存的原始设置可以匹配
-                            if hasattr(self, 'original_settings') and device.DeviceName in self.original_settings:
+                            if device.DeviceName in self.original_settings:
                                 original = self.original_settings[device.DeviceName]
                                 if (original['position_x'] == monitor['x'] and 
                                     original['position_y'] == monitor['y'] and
@@ -447,319 +709,419 @@ class ScreenController:
 
     def create_widgets(self):
         """创建主界面组件"""
-        # 预览区域框架
-        preview_frame = tk.Frame(self.root)
-        preview_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        
-        # 确保至少显示两个屏幕预览（即使只有一个屏幕）
-        display_monitors = self.monitors[:2] if len(self.monitors) >= 2 else self.monitors + [None] * (2 - len(self.monitors))
+        # 预览区域框架，每个屏幕占一列
+        self.preview_frame = tk.Frame(self.root)
+        self.preview_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.preview_frame.rowconfigure(0, weight=1)
         
         self.preview_widgets = []
+        self.widget_by_slot = {}
+        self.placeholder_frames = []
+        self.validate_time_command = (self.root.register(self.validate_time_input), '%P')
         
-        for i, monitor in enumerate(display_monitors):
-            # 每个屏幕的容器
-            screen_frame = tk.Frame(preview_frame, relief=tk.RAISED, borderwidth=2)
-            screen_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-            
-            if monitor:
-                # 显示器名称（移到预览窗口上方）
-                title = f"{monitor['name']} ({'主屏' if monitor['is_primary'] else '副屏'})"
-                screen_title = tk.Label(screen_frame, text=title, 
-                                      font=("./29华康宋体W3.ttf", 12, "bold"))
-                screen_title.pack(pady=(5, 2))
-                
-                # 预览窗口
-                preview_canvas = tk.Canvas(screen_frame, width=300, height=200, 
-                                         bg="black", relief=tk.SUNKEN, borderwidth=2)
-                preview_canvas.pack(pady=2)
-                
-                # 分辨率信息（移到预览窗口下方）
-                info_text = f"分辨率: {monitor['width']} x {monitor['height']}"
-                info_label = tk.Label(screen_frame, text=info_text, 
-                                    font=("./29华康宋体W3.ttf", 10))
-                info_label.pack(pady=2)
-                
-                # 自动熄屏时间设置框架
-                auto_frame = tk.Frame(screen_frame)
-                auto_frame.pack(pady=2)
-                
-                # 加载显示器配置
-                config = self.load_monitor_config(monitor)
-                start_parts = config['start_time'].split(':')
-                end_parts = config['end_time'].split(':')
-                
-                # 开始时间设置
-                start_time_frame = tk.Frame(auto_frame)
-                start_time_frame.pack(pady=1)
-                tk.Label(start_time_frame, text="开始时间:", font=("./29华康宋体W3.ttf", 8)).pack(side=tk.LEFT)
-                start_hour_var = tk.StringVar(value=start_parts[0] if len(start_parts) > 0 else "18")
-                start_min_var = tk.StringVar(value=start_parts[1] if len(start_parts) > 1 else "00")
-                start_sec_var = tk.StringVar(value=start_parts[2] if len(start_parts) > 2 else "00")
-                # 创建时间变化回调函数
-                def on_time_change(*args, m=monitor):
-                    self.save_time_config(m)
-                
-                start_hour_var.trace('w', on_time_change)
-                start_min_var.trace('w', on_time_change)
-                start_sec_var.trace('w', on_time_change)
-                
-                # 创建开始时间的Spinbox控件
-                start_hour_spinbox = tk.Spinbox(start_time_frame, from_=0, to=23, width=3, textvariable=start_hour_var, 
-                          font=("./29华康宋体W3.ttf", 8), state="disabled" if config['auto_enabled'] else "normal")
-                start_hour_spinbox.pack(side=tk.LEFT, padx=1)
-                tk.Label(start_time_frame, text=":", font=("./29华康宋体W3.ttf", 8)).pack(side=tk.LEFT)
-                start_min_spinbox = tk.Spinbox(start_time_frame, from_=0, to=59, width=3, textvariable=start_min_var, 
-                          font=("./29华康宋体W3.ttf", 8), state="disabled" if config['auto_enabled'] else "normal")
-                start_min_spinbox.pack(side=tk.LEFT, padx=1)
-                tk.Label(start_time_frame, text=":", font=("./29华康宋体W3.ttf", 8)).pack(side=tk.LEFT)
-                start_sec_spinbox = tk.Spinbox(start_time_frame, from_=0, to=59, width=3, textvariable=start_sec_var, 
-                          font=("./29华康宋体W3.ttf", 8), state="disabled" if config['auto_enabled'] else "normal")
-                start_sec_spinbox.pack(side=tk.LEFT, padx=1)
-                
-                # 结束时间设置
-                end_time_frame = tk.Frame(auto_frame)
-                end_time_frame.pack(pady=1)
-                tk.Label(end_time_frame, text="结束时间:", font=("./29华康宋体W3.ttf", 8)).pack(side=tk.LEFT)
-                end_hour_var = tk.StringVar(value=end_parts[0] if len(end_parts) > 0 else "07")
-                end_min_var = tk.StringVar(value=end_parts[1] if len(end_parts) > 1 else "00")
-                end_sec_var = tk.StringVar(value=end_parts[2] if len(end_parts) > 2 else "00")
-                end_hour_var.trace('w', on_time_change)
-                end_min_var.trace('w', on_time_change)
-                end_sec_var.trace('w', on_time_change)
-                
-                # 创建结束时间的Spinbox控件
-                end_hour_spinbox = tk.Spinbox(end_time_frame, from_=0, to=23, width=3, textvariable=end_hour_var, 
-                          font=("./29华康宋体W3.ttf", 8), state="disabled" if config['auto_enabled'] else "normal")
-                end_hour_spinbox.pack(side=tk.LEFT, padx=1)
-                tk.Label(end_time_frame, text=":", font=("./29华康宋体W3.ttf", 8)).pack(side=tk.LEFT)
-                end_min_spinbox = tk.Spinbox(end_time_frame, from_=0, to=59, width=3, textvariable=end_min_var, 
-                          font=("./29华康宋体W3.ttf", 8), state="disabled" if config['auto_enabled'] else "normal")
-                end_min_spinbox.pack(side=tk.LEFT, padx=1)
-                tk.Label(end_time_frame, text=":", font=("./29华康宋体W3.ttf", 8)).pack(side=tk.LEFT)
-                end_sec_spinbox = tk.Spinbox(end_time_frame, from_=0, to=59, width=3, textvariable=end_sec_var, 
-                          font=("./29华康宋体W3.ttf", 8), state="disabled" if config['auto_enabled'] else "normal")
-                end_sec_spinbox.pack(side=tk.LEFT, padx=1)
-                
-                # 按钮框架
-                button_frame = tk.Frame(screen_frame)
-                button_frame.pack(pady=2)
-                
-                # 手动熄屏按钮
-                manual_off_btn = tk.Button(button_frame, text="手动熄屏", 
-                                         command=lambda m=monitor: self.turn_off_screen(m),
-                                         bg="#ff6b6b", fg="white", 
-                                         font=("./29华康宋体W3.ttf", 9, "bold"),
-                                         width=8, height=1)
-                manual_off_btn.pack(side=tk.LEFT, padx=2)
-                
-                # 自动熄屏按钮
-                auto_off_btn = tk.Button(button_frame, text="自动熄屏", 
-                                       command=lambda m=monitor: self.toggle_auto_screen_off(m),
-                                       bg="#fd7e14", fg="white", 
-                                       font=("./29华康宋体W3.ttf", 9, "bold"),
-                                       width=8, height=1)
-                auto_off_btn.pack(side=tk.LEFT, padx=2)
-                
-                # 自动熄屏状态显示
-                auto_status_text = "启用" if config['auto_enabled'] else "禁用"
-                auto_status_color = "green" if config['auto_enabled'] else "red"
-                auto_status_label = tk.Label(button_frame, text=auto_status_text, 
-                                            font=("./29华康宋体W3.ttf", 8),
-                                            fg=auto_status_color)
-                auto_status_label.pack(side=tk.LEFT, padx=2)
-                
-
-                
-                self.preview_widgets.append({
-                    'canvas': preview_canvas,
-                    'monitor': monitor,
-                    'title': screen_title,
-                    'info': info_label,
-                    'start_hour_var': start_hour_var,
-                    'start_min_var': start_min_var,
-                    'start_sec_var': start_sec_var,
-                    'end_hour_var': end_hour_var,
-                    'end_min_var': end_min_var,
-                    'end_sec_var': end_sec_var,
-                    'start_hour_spinbox': start_hour_spinbox,
-                    'start_min_spinbox': start_min_spinbox,
-                    'start_sec_spinbox': start_sec_spinbox,
-                    'end_hour_spinbox': end_hour_spinbox,
-                    'end_min_spinbox': end_min_spinbox,
-                    'end_sec_spinbox': end_sec_spinbox,
-                    'auto_status_label': auto_status_label,
-                    'auto_enabled': config['auto_enabled']
-                })
-            else:
-                # 无屏幕时的占位符
-                no_screen_label = tk.Label(screen_frame, text="未检测到屏幕", 
-                                         font=("./29华康宋体W3.ttf", 12),
-                                         fg="gray")
-                no_screen_label.pack(expand=True)
+        self.update_preview_slots()
         
         # 底部控制区域
         control_frame = tk.Frame(self.root)
         control_frame.pack(fill=tk.X, padx=10, pady=10)
         
         # 刷新按钮
-        refresh_btn = tk.Button(control_frame, text="刷新屏幕信息", 
-                              command=self.refresh_screens,
-                              bg="#339af0", fg="white", 
-                              font=("./29华康宋体W3.ttf", 10, "bold"))
+        refresh_btn = ttk.Button(control_frame, text="刷新屏幕信息", 
+                               command=self.refresh_screens,
+                               style='Primary.TButton')
         refresh_btn.pack(side=tk.LEFT, padx=5)
         
         # 检测间隔设置
         interval_frame = tk.Frame(control_frame)
         interval_frame.pack(side=tk.LEFT, padx=10)
         
-        tk.Label(interval_frame, text="检测间隔:", font=("./29华康宋体W3.ttf", 9)).pack(side=tk.LEFT)
+        tk.Label(interval_frame, text="检测间隔:", font=self.font_md).pack(side=tk.LEFT)
         
         self.detection_interval_var = tk.StringVar(value=str(self.detection_interval))
         interval_spinbox = tk.Spinbox(interval_frame, from_=1, to=60, width=5,
                                     textvariable=self.detection_interval_var,
-                                    font=("./29华康宋体W3.ttf", 9),
-                                    command=self.save_detection_interval)
+                                    font=self.font_md)
         interval_spinbox.pack(side=tk.LEFT, padx=2)
         
-        tk.Label(interval_frame, text="秒", font=("./29华康宋体W3.ttf", 9)).pack(side=tk.LEFT)
+        tk.Label(interval_frame, text="秒", font=self.font_md).pack(side=tk.LEFT)
         
-        # 绑定变量变化事件
-        self.detection_interval_var.trace('w', lambda *args: self.save_detection_interval())
+        # 绑定变量变化事件（包括点击箭头和键盘输入）
+        self.detection_interval_var.trace('w', lambda *args: self.mark_config_dirty('SETTINGS'))
         
         # 显示模式控制区域（中间）
         display_mode_frame = tk.Frame(control_frame)
         display_mode_frame.pack(side=tk.LEFT, expand=True)
         
         # 退出按钮
-        exit_btn = tk.Button(control_frame, text="退出", 
-                           command=self.on_closing,
-                           bg="#e03131", fg="white", 
-                           font=("./29华康宋体W3.ttf", 10, "bold"))
+        exit_btn = ttk.Button(control_frame, text="退出", 
+                            command=self.on_closing,
+                            style='Exit.TButton')
         exit_btn.pack(side=tk.RIGHT, padx=5)
         
         # 重置显示器按钮
-        reset_btn = tk.Button(control_frame, text="重置显示器", 
-                            command=self.reset_displays,
-                            bg="#fd7e14", fg="white", 
-                            font=("./29华康宋体W3.ttf", 10, "bold"),
-                            width=12)
+        reset_btn = ttk.Button(control_frame, text="重置显示器", 
+                             command=self.reset_displays,
+                             style='Large.Warning.TButton', width=12)
         reset_btn.pack(side=tk.RIGHT, padx=5)
         
         # 重置显示器说明文本
         reset_info_label = tk.Label(control_frame, text="熄屏后需用重置显示器恢复。也可用快捷键CTRL+ALT+X恢复⇢", 
-                                   font=("./29华康宋体W3.ttf", 9), fg="#666666")
+                                   font=self.font_md, fg="#666666")
         reset_info_label.pack(side=tk.RIGHT, padx=5)
         
         # 为重置按钮添加工具提示
-        ToolTip(reset_btn, "快捷键: Ctrl+Alt+X")
+        ToolTip(reset_btn, "快捷键: Ctrl+Alt+X", font=self.font_md)
+    
+    def update_preview_slots(self):
+        """根据当前屏幕信息更新预览区域
+        
+        按显示器配置键比较新旧屏幕，只销毁消失的屏幕区域、创建新增的屏幕区域，
+        其余屏幕区域保留原有控件，只更新显示器信息
+        """
+        # 确保至少显示两个屏幕预览（即使只有一个屏幕）
+        display_monitors = self.monitors[:2] if len(self.monitors) >= 2 else self.monitors + [None] * (2 - len(self.monitors))
+        
+        # 占位符没有状态，直接重新创建
+        for placeholder in self.placeholder_frames:
+            placeholder.destroy()
+        self.placeholder_frames = []
+        
+        old_widgets = dict(self.widget_by_slot)
+        preview_widgets = []
+        widget_by_slot = {}
+        
+        for column, monitor in enumerate(display_monitors):
+            self.preview_frame.columnconfigure(column, weight=1, uniform="screen")
+            
+            if monitor:
+                slot_key = self.get_monitor_slot_key(monitor)
+                widget_info = old_widgets.pop(slot_key, None)
+                if widget_info is None:
+                    widget_info = self.create_screen_frame(monitor, slot_key)
+                    self.schedule_auto_check(widget_info)
+                else:
+                    # 保留的屏幕只更新显示器信息，显示器信息没有变化时不修改控件
+                    if widget_info['monitor'] != monitor:
+                        widget_info['monitor'] = monitor
+                        widget_info['title'].config(text=self.get_screen_title(monitor))
+                        widget_info['info'].config(text=self.get_screen_info_text(monitor))
+                
+                widget_info['frame'].grid(row=0, column=column, sticky="nsew", padx=5)
+                preview_widgets.append(widget_info)
+                widget_by_slot[slot_key] = widget_info
+            else:
+                # 无屏幕时的占位符
+                screen_frame = tk.Frame(self.preview_frame, relief=tk.RAISED, borderwidth=2)
+                screen_frame.grid(row=0, column=column, sticky="nsew", padx=5)
+                no_screen_label = tk.Label(screen_frame, text="未检测到屏幕", 
+                                         font=self.font_xl,
+                                         fg="gray")
+                no_screen_label.pack(expand=True)
+                self.placeholder_frames.append(screen_frame)
+        
+        # 销毁已经不存在的屏幕区域
+        for widget_info in old_widgets.values():
+            self.cancel_auto_check(widget_info)
+            widget_info['frame'].destroy()
+        
+        self.preview_widgets = preview_widgets
+        self.widget_by_slot = widget_by_slot
+    
+    def get_screen_title(self, monitor):
+        """屏幕区域标题"""
+        return f"{monitor['name']} ({'主屏' if monitor['is_primary'] else '副屏'})"
+    
+    def get_screen_info_text(self, monitor):
+        """屏幕区域的分辨率信息"""
+        return f"分辨率: {monitor['width']} x {monitor['height']}"
+    
+    def create_screen_frame(self, monitor, slot_key):
+        """创建单个屏幕的预览和控制区域"""
+        # 每个屏幕的容器
+        screen_frame = tk.Frame(self.preview_frame, relief=tk.RAISED, borderwidth=2)
+        widget_info = {'frame': screen_frame, 'monitor': monitor, 'slot_key': slot_key}
+        
+        # 显示器名称（移到预览窗口上方）
+        screen_title = tk.Label(screen_frame, text=self.get_screen_title(monitor), 
+                              font=self.font_title)
+        screen_title.pack(pady=(5, 2))
+        
+        # 预览窗口
+        preview_canvas = tk.Canvas(screen_frame, width=PREVIEW_WIDTH, height=PREVIEW_HEIGHT, 
+                                 bg="black", relief=tk.SUNKEN, borderwidth=2)
+        preview_canvas.pack(pady=2)
+        
+        # 预览图像只创建一次，之后原地更新像素
+        preview_photo = ImageTk.PhotoImage(Image.new('RGB', (PREVIEW_WIDTH, PREVIEW_HEIGHT)))
+        preview_image_item = preview_canvas.create_image(PREVIEW_WIDTH // 2, PREVIEW_HEIGHT // 2, image=preview_photo)
+        
+        # 分辨率信息（移到预览窗口下方）
+        info_label = tk.Label(screen_frame, text=self.get_screen_info_text(monitor), 
+                            font=self.font_lg)
+        info_label.pack(pady=2)
+        
+        # 自动熄屏时间设置框架
+        auto_frame = tk.Frame(screen_frame)
+        auto_frame.pack(pady=2)
+        
+        # 加载显示器配置
+        config = self.load_monitor_config(monitor)
+        time_state = "disabled" if config['auto_enabled'] else "normal"
+        
+        # 创建时间变化回调函数
+        def on_time_change(*args):
+            self.mark_config_dirty(slot_key)
+        
+        # 开始时间设置
+        start_time_frame = tk.Frame(auto_frame)
+        start_time_frame.pack(pady=1)
+        tk.Label(start_time_frame, text="开始时间:", font=self.font_sm).pack(side=tk.LEFT)
+        start_time_var = tk.StringVar(value=self.format_time_text(config['start_time']))
+        start_time_var.trace('w', on_time_change)
+        start_time_entry = tk.Entry(start_time_frame, width=9, textvariable=start_time_var,
+                                    font=self.font_sm, state=time_state,
+                                    validate="key", validatecommand=self.validate_time_command)
+        start_time_entry.pack(side=tk.LEFT, padx=1)
+        start_time_entry.bind("<FocusOut>", lambda e, wi=widget_info: self.normalize_time_input(wi, 'start_time'))
+        
+        # 结束时间设置
+        end_time_frame = tk.Frame(auto_frame)
+        end_time_frame.pack(pady=1)
+        tk.Label(end_time_frame, text="结束时间:", font=self.font_sm).pack(side=tk.LEFT)
+        end_time_var = tk.StringVar(value=self.format_time_text(config['end_time']))
+        end_time_var.trace('w', on_time_change)
+        end_time_entry = tk.Entry(end_time_frame, width=9, textvariable=end_time_var,
+                                  font=self.font_sm, state=time_state,
+                                  validate="key", validatecommand=self.validate_time_command)
+        end_time_entry.pack(side=tk.LEFT, padx=1)
+        end_time_entry.bind("<FocusOut>", lambda e, wi=widget_info: self.normalize_time_input(wi, 'end_time'))
+        
+        # 按钮框架
+        button_frame = tk.Frame(screen_frame)
+        button_frame.pack(pady=2)
+        
+        # 手动熄屏按钮
+        manual_off_btn = ttk.Button(button_frame, text="手动熄屏", 
+                                  command=lambda wi=widget_info: self.turn_off_screen(wi['monitor']),
+                                  style='Danger.TButton', width=8)
+        manual_off_btn.pack(side=tk.LEFT, padx=2)
+        
+        # 自动熄屏按钮
+        auto_off_btn = ttk.Button(button_frame, text="自动熄屏", 
+                                command=lambda wi=widget_info: self.toggle_auto_screen_off(wi),
+                                style='Warning.TButton', width=8)
+        auto_off_btn.pack(side=tk.LEFT, padx=2)
+        
+        # 自动熄屏状态显示
+        auto_status_text = "启用" if config['auto_enabled'] else "禁用"
+        auto_status_color = "green" if config['auto_enabled'] else "red"
+        auto_status_label = tk.Label(button_frame, text=auto_status_text, 
+                                    font=self.font_sm,
+                                    fg=auto_status_color)
+        auto_status_label.pack(side=tk.LEFT, padx=2)
+        
+        widget_info.update({
+            'canvas': preview_canvas,
+            'photo': preview_photo,
+            'image_item': preview_image_item,
+            'title': screen_title,
+            'info': info_label,
+            'start_time_var': start_time_var,
+            'end_time_var': end_time_var,
+            'start_time_entry': start_time_entry,
+            'end_time_entry': end_time_entry,
+            'auto_status_label': auto_status_label,
+            'auto_enabled': config['auto_enabled'],
+            'auto_timer': None,
+            'frame_signature': None
+        })
+        return widget_info
+    
+    def create_capture_surfaces(self):
+        """为每个屏幕创建截图资源（桌面DC、内存DC和预览位图），在启动预览时创建并重复使用
+        
+        截图资源在主线程中创建和释放（ReleaseDC必须与GetDC在同一线程调用），
+        截图线程只使用已经创建的资源；同一屏幕同一时间只有一个截图任务使用这些资源
+        """
+        # win32ui会加载MFC运行库，只在启动预览时导入
+        import win32ui
+        preview_width, preview_height = PREVIEW_WIDTH, PREVIEW_HEIGHT
+        for monitor in self.monitors:
+            if monitor['id'] in self.capture_surfaces:
+                continue
+            screen_dc = win32gui.GetDC(0)
+            mem_dc = win32gui.CreateCompatibleDC(screen_dc)
+            bitmap = win32gui.CreateCompatibleBitmap(screen_dc, preview_width, preview_height)
+            self.capture_surfaces[monitor['id']] = {
+                'screen_dc': screen_dc,
+                'mem_dc': mem_dc,
+                'bitmap': bitmap,
+                'bitmap_obj': win32ui.CreateBitmapFromHandle(bitmap)
+            }
+    
+    def release_capture_surfaces(self):
+        """释放所有截图资源（在主线程中调用）"""
+        for surface in self.capture_surfaces.values():
+            try:
+                win32gui.DeleteObject(surface['bitmap'])
+                win32gui.DeleteDC(surface['mem_dc'])
+                win32gui.ReleaseDC(0, surface['screen_dc'])
+            except Exception:
+                pass
+        self.capture_surfaces.clear()
     
     def capture_screen_preview(self, monitor):
-        """捕获屏幕预览"""
+        """捕获屏幕预览
+        
+        返回(预览图像, 画面标识)，画面标识相同说明画面没有变化；错误提示图像的标识为None
+        """
+        # 屏幕已熄屏时截图只会得到黑屏，直接返回黑色预览
+        # 按设备名称判断，两台相同型号的显示器不会互相影响；没有熄屏的显示器时不查询设备名称
+        if self.monitor_off and self.get_device_name_by_monitor(monitor) in self.monitor_off:
+            return self.black_preview, 'off'
+        
         try:
-            # 获取指定屏幕区域的截图
-            left = monitor['x']
-            top = monitor['y']
-            right = left + monitor['width']
-            bottom = top + monitor['height']
-            
-            # 使用PIL的ImageGrab捕获整个虚拟屏幕，然后裁剪指定区域
-            # 这样可以处理负坐标的情况
-            # 计算所有屏幕的边界来确定虚拟屏幕范围
-            all_left = min(m['x'] for m in self.monitors)
-            all_top = min(m['y'] for m in self.monitors)
-            all_right = max(m['x'] + m['width'] for m in self.monitors)
-            all_bottom = max(m['y'] + m['height'] for m in self.monitors)
-            
-            # 捕获包含所有屏幕的区域
-            # 使用all_screens=True参数来支持多屏幕截图
-            full_screenshot = ImageGrab.grab(bbox=(all_left, all_top, all_right, all_bottom), all_screens=True)
+            preview_width, preview_height = PREVIEW_WIDTH, PREVIEW_HEIGHT
+            src_left, src_top, src_width, src_height = monitor['capture_rect']
+            surface = self.capture_surfaces[monitor['id']]
+            mem_dc = surface['mem_dc']
             
-            # 获取虚拟屏幕的总尺寸
-            virtual_width = full_screenshot.width
-            virtual_height = full_screenshot.height
-            
-            # 计算在捕获图像中的相对坐标
-            # 由于我们捕获的是从(all_left, all_top)开始的区域
-            crop_left = left - all_left
-            crop_top = top - all_top
-            crop_right = crop_left + monitor['width']
-            crop_bottom = crop_top + monitor['height']
-            
-            # 确保裁剪区域在有效范围内
-            crop_left = max(0, crop_left)
-            crop_top = max(0, crop_top)
-            crop_right = min(virtual_width, crop_right)
-            crop_bottom = min(virtual_height, crop_bottom)
-            
-            # 裁剪指定区域
-            screenshot = full_screenshot.crop((crop_left, crop_top, crop_right, crop_bottom))
+            old_bitmap = win32gui.SelectObject(mem_dc, surface['bitmap'])
+            try:
+                # 直接从桌面DC拷贝指定屏幕区域，由驱动缩放到预览大小，无需再用PIL缩放
+                # 桌面DC使用虚拟屏幕坐标，可以直接处理负坐标的情况
+                win32gui.SetStretchBltMode(mem_dc, self.preview_stretch_mode)
+                win32gui.StretchBlt(mem_dc, 0, 0, preview_width, preview_height,
+                                    surface['screen_dc'], src_left, src_top, src_width, src_height, win32con.SRCCOPY)
+            finally:
+                win32gui.SelectObject(mem_dc, old_bitmap)
             
-            # 缩放到预览窗口大小
-            preview_width, preview_height = 300, 200
-            screenshot = screenshot.resize((preview_width, preview_height), Image.Resampling.LANCZOS)
+            # 读取位图像素（BGRX格式）
+            bits = surface['bitmap_obj'].GetBitmapBits(True)
             
             # 直接返回截图，不添加任何文字覆盖层
-            return ImageTk.PhotoImage(screenshot)
+            # 此方法在线程池中运行，PhotoImage的转换留给主线程
+            # 预览位图只有几百KB，直接用像素数据作为画面标识
+            return Image.frombuffer('RGB', (preview_width, preview_height), bits, 'raw', 'BGRX', 0, 1), bits
             
         except Exception as e:
             # 如果截图失败，创建一个错误提示图像
-            return self.create_error_preview(monitor, str(e))
+            return self.create_error_preview(monitor, str(e)), None
+    
+    @classmethod
+    def get_error_font(cls):
+        """错误提示预览使用的字体，只加载一次字体文件"""
+        if cls.error_font is None:
+            try:
+                cls.error_font = ImageFont.truetype("./29华康宋体W3.ttf", 12)
+            except:
+                cls.error_font = ImageFont.load_default()
+        return cls.error_font
     
     def create_error_preview(self, monitor, error_msg):
         """创建错误提示预览图像"""
         try:
-            width, height = 300, 200
-            image = Image.new('RGB', (width, height), color='#2c3e50')
+            cls = type(self)
+            if cls.error_background is None:
+                cls.error_background = Image.new('RGB', (PREVIEW_WIDTH, PREVIEW_HEIGHT), color='#2c3e50')
+            image = cls.error_background.copy()
             
-            from PIL import ImageDraw, ImageFont
             draw = ImageDraw.Draw(image)
             
-            try:
-                font = ImageFont.truetype("./29华康宋体W3.ttf", 12)
-            except:
-                font = ImageFont.load_default()
-            
             # 绘制错误信息
             text = f"{monitor['name']}\n{monitor['width']} x {monitor['height']}\n\n无法获取预览\n{error_msg[:30]}..."
-            draw.text((10, 10), text, fill='white', font=font)
+            draw.text((10, 10), text, fill='white', font=self.get_error_font())
             
-            return ImageTk.PhotoImage(image)
+            return image
         except:
             return None
     
-    def update_previews(self):
-        """更新屏幕预览"""
-        while self.preview_running:
-            try:
-                # 检查preview_widgets是否存在且不为空
-                if not hasattr(self, 'preview_widgets') or not self.preview_widgets:
-                    time.sleep(1)
+    def on_root_unmap(self, event):
+        """主窗口最小化/隐藏"""
+        if event.widget is self.root:
+            self.ui_visible = False
+    
+    def on_root_map(self, event):
+        """主窗口恢复显示"""
+        if event.widget is self.root:
+            self.ui_visible = True
+    
+    def capture_monitor_frame(self, monitor):
+        """在线程池中截取单个屏幕的预览，返回屏幕编号和(预览图像, 画面标识)"""
+        return monitor['id'], self.capture_screen_preview(monitor)
+    
+    def start_previews(self):
+        """启动预览更新（截图由线程池完成，界面更新在主线程中进行）"""
+        self.create_capture_surfaces()
+        self.preview_pool = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(self.monitors)))
+        self.preview_futures = {}
+        self.preview_tick_id = self.root.after(0, self.preview_tick, 0)
+    
+    def stop_previews(self):
+        """停止预览更新，等待正在进行的截图完成并丢弃未显示的预览帧"""
+        if self.preview_tick_id:
+            self.root.after_cancel(self.preview_tick_id)
+            self.preview_tick_id = None
+        self.preview_pool.shutdown(wait=True)
+        with self.preview_frames_lock:
+            self.preview_frames.clear()
+    
+    def preview_tick(self, index):
+        """预览定时器：每次只提交一个屏幕的截图，各屏幕在一个预览周期内错开进行"""
+        widget_count = len(self.preview_widgets)
+        
+        # 窗口最小化或预览窗口不可见时跳过截图
+        if widget_count and self.ui_visible:
+            widget_info = self.preview_widgets[index % widget_count]
+            monitor = widget_info['monitor']
+            future = self.preview_futures.get(monitor['id'])
+            # 上一次截图还未完成时跳过，避免任务堆积
+            if (future is None or future.done()) and widget_info['canvas'].winfo_viewable():
+                future = self.preview_pool.submit(self.capture_monitor_frame, monitor)
+                future.add_done_callback(self.store_preview_frame)
+                self.preview_futures[monitor['id']] = future
+        
+        # 按设定帧率在各屏幕之间平均分配更新间隔
+        slots = max(widget_count, 1)
+        delay = max(1, int(1000 / self.preview_fps / slots))
+        self.preview_tick_id = self.root.after(delay, self.preview_tick, (index + 1) % slots)
+    
+    def store_preview_frame(self, future):
+        """截图完成回调（在线程池中执行），保存最新的预览帧等待主线程显示"""
+        try:
+            monitor_id, frame = future.result()
+        except Exception:
+            return
+        if frame[0]:
+            with self.preview_frames_lock:
+                self.preview_frames[monitor_id] = frame
+    
+    def drain_preview_frames(self):
+        """在主线程中显示最新的预览帧"""
+        # 先安排下一次显示，显示出错时预览更新不会中断
+        self.preview_drain_id = self.root.after(self.preview_drain_interval, self.drain_preview_frames)
+        
+        with self.preview_frames_lock:
+            frames = self.preview_frames
+            self.preview_frames = {}
+        
+        if frames:
+            pasted = False
+            for widget_info in self.preview_widgets:
+                frame = frames.get(widget_info['monitor']['id'])
+                if frame is None:
                     continue
-                    
-                for i, widget_info in enumerate(self.preview_widgets):
-                    if not self.preview_running:
-                        break
-                        
-                    if widget_info['monitor']:
-                        # 检查canvas是否仍然有效
-                        try:
-                            canvas = widget_info['canvas']
-                            canvas.winfo_exists()
-                        except Exception:
-                            continue
-                        
-                        preview_image = self.capture_screen_preview(widget_info['monitor'])
-                        if preview_image:
-                            try:
-                                canvas.delete("all")
-                                canvas.create_image(150, 100, image=preview_image)
-                                canvas.image = preview_image  # 保持引用
-                            except Exception:
-                                pass
-                
-                time.sleep(1)  # 每秒更新一次
-            except Exception:
-                time.sleep(1)
+                # 画面没有变化时不再更新PhotoImage
+                preview_image, signature = frame
+                if signature is not None and signature == widget_info['frame_signature']:
+                    continue
+                widget_info['photo'].paste(preview_image)
+                widget_info['frame_signature'] = signature
+                pasted = True
+            
+            # 所有预览更新完成后统一重绘一次
+            if pasted:
+                self.root.update_idletasks()
     
     def turn_off_screen(self, monitor):
         """熄灭指定屏幕"""
@@ -774,8 +1136,6 @@ class ScreenController:
             current_settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
             
             # 保存原始设置用于恢复
-            if not hasattr(self, 'original_settings'):
-                self.original_settings = {}
             self.original_settings[device_name] = {
                 'width': current_settings.PelsWidth,
                 'height': current_settings.PelsHeight,
@@ -793,6 +1153,11 @@ class ScreenController:
             result = win32api.ChangeDisplaySettingsEx(device_name, new_settings, 0)
             if result != win32con.DISP_CHANGE_SUCCESSFUL:
                 messagebox.showerror("错误", f"熄屏失败，错误代码: {result}")
+            else:
+                # 记录熄屏状态，熄屏期间不再截取该屏幕的预览
+                self.monitor_off[device_name] = True
+                self.display_settings_cache.pop(device_name, None)
+                self.invalidate_screen_info()
                 
         except Exception as e:
             messagebox.showerror("错误", f"熄屏失败: {str(e)}")
@@ -805,6 +1170,8 @@ class ScreenController:
     
     def force_refresh_displays(self):
         """强制刷新显示器配置"""
+        self.invalidate_display_caches()
+        self.display_changed.clear()
         try:
             # 方法1: 使用ChangeDisplaySettings刷新所有显示器
             result = win32api.ChangeDisplaySettings(None, 0)
@@ -815,7 +1182,6 @@ class ScreenController:
                 print(f"刷新显示器配置失败，错误代码: {result}")
                 
             # 方法2: 如果方法1失败，尝试重新应用当前设置
-            import time
             time.sleep(0.2)
             
             # 枚举所有显示设备并重新应用设置
@@ -854,17 +1220,17 @@ class ScreenController:
     def restore_all_screens(self):
         """恢复所有被熄屏的显示器"""
         try:
-            if not hasattr(self, 'original_settings') or not self.original_settings:
+            if not self.original_settings:
                 return
             
             # 首先尝试强制刷新显示器配置
             if self.force_refresh_displays():
-                # 等待系统处理
-                import time
-                time.sleep(1.0)
+                # 等待系统通知显示设置已变化
+                self.display_changed.wait(1.0)
                 
                 # 清空原始设置，因为已经通过刷新恢复了
                 self.original_settings.clear()
+                self.monitor_off.clear()
                 return
             
             # 重新枚举所有显示设备
@@ -904,28 +1270,52 @@ class ScreenController:
                     new_settings.Position_y = original['position_y']
                     new_settings.Fields = win32con.DM_PELSWIDTH | win32con.DM_PELSHEIGHT | win32con.DM_POSITION
                     
-                    result = win32api.ChangeDisplaySettingsEx(device_name, new_settings, win32con.CDS_UPDATEREGISTRY)
+                    result = win32api.ChangeDisplaySettingsEx(device_name, new_settings, DISPLAY_BATCH_FLAGS)
                     if result == win32con.DISP_CHANGE_SUCCESSFUL:
                         restored_count += 1
                         
                 except Exception:
                     pass
             
-            if restored_count > 0:
+            if restored_count > 0 and self.commit_display_changes():
                 # 清空已恢复的设置
                 self.original_settings.clear()
+                self.monitor_off.clear()
                 
         except Exception:
             pass
     
+    def commit_display_changes(self):
+        """一次性应用以CDS_NORESET暂存的显示设置，只触发一次显示模式切换"""
+        result = win32api.ChangeDisplaySettingsEx()
+        self.invalidate_display_caches()
+        return result == win32con.DISP_CHANGE_SUCCESSFUL
+    
+    def schedule_display_refresh(self, timeout_ms=1500):
+        """在收到WM_DISPLAYCHANGE后刷新屏幕信息，超时仍未收到通知时也刷新"""
+        if self.display_refresh_id:
+            self.root.after_cancel(self.display_refresh_id)
+        self.display_refresh_id = self.root.after(timeout_ms, self.run_display_refresh)
+    
+    def run_display_refresh(self):
+        """执行等待中的屏幕信息刷新"""
+        self.display_refresh_id = None
+        self.refresh_screens()
+    
+    def on_display_change(self):
+        """显示设置变化通知（主线程中执行），有等待中的刷新时立即刷新"""
+        if self.display_refresh_id:
+            self.root.after_cancel(self.display_refresh_id)
+            self.run_display_refresh()
+    
     def get_all_available_monitors(self):
         """获取所有可用的显示器，包括被熄屏的"""
         try:
             # 获取当前检测到的显示器
-            current_monitors = self.get_screen_info()
+            current_monitors = self.cached_screen_info()
             
             # 如果有保存的原始设置，说明有显示器被熄屏了
-            if hasattr(self, 'original_settings') and self.original_settings:
+            if self.original_settings:
                 # 检查是否有被熄屏但未在当前列表中的显示器
                 current_device_names = set()
                 for monitor in current_monitors:
@@ -941,6 +1331,63 @@ class ScreenController:
         except Exception:
             return len(self.monitors), self.monitors
     
+    def get_layout_size(self, device_name, monitor):
+        """显示器在新排列中使用的分辨率，被熄屏的显示器使用熄屏前的分辨率"""
+        original = self.original_settings.get(device_name)
+        if original:
+            return original['width'], original['height']
+        return monitor['width'], monitor['height']
+    
+    def compute_duplicate_layout(self):
+        """计算复制模式的显示器排列：副显示器与主显示器位置和分辨率相同
+        
+        返回(设备名称, x, y, 宽, 高)列表，找不到主显示器时返回None
+        """
+        primary_monitor = next((monitor for monitor in self.monitors if monitor['is_primary']), None)
+        if not primary_monitor:
+            return None
+        
+        layout = []
+        for monitor in self.monitors:
+            if not monitor['is_primary']:
+                device_name = self.get_device_name_by_monitor(monitor)
+                if device_name:
+                    layout.append((device_name, 0, 0, primary_monitor['width'], primary_monitor['height']))
+        return layout
+    
+    def compute_extend_layout(self):
+        """计算扩展模式的显示器排列：主显示器在原点，副显示器依次排列在主显示器右侧
+        
+        返回(设备名称, x, y, 宽, 高)列表
+        """
+        layout = []
+        x_offset = 0
+        # 主显示器排在最前
+        for monitor in sorted(self.monitors, key=lambda monitor: not monitor['is_primary']):
+            device_name = self.get_device_name_by_monitor(monitor)
+            width, height = self.get_layout_size(device_name, monitor)
+            if device_name:
+                layout.append((device_name, x_offset, 0, width, height))
+            x_offset += width
+        return layout
+    
+    def apply_layout(self, layout):
+        """按(设备名称, x, y, 宽, 高)列表暂存各显示器的新设置，最后一次性应用"""
+        for device_name, x, y, width, height in layout:
+            try:
+                new_settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
+                new_settings.Position_x = x
+                new_settings.Position_y = y
+                new_settings.PelsWidth = width
+                new_settings.PelsHeight = height
+                new_settings.Fields = win32con.DM_POSITION | win32con.DM_PELSWIDTH | win32con.DM_PELSHEIGHT
+                win32api.ChangeDisplaySettingsEx(device_name, new_settings, DISPLAY_BATCH_FLAGS)
+            except Exception:
+                pass
+        
+        # 一次性应用所有显示器的新设置
+        return self.commit_display_changes()
+    
     def set_duplicate_mode_api(self):
         """使用API设置复制模式"""
         try:
@@ -951,47 +1398,21 @@ class ScreenController:
                 messagebox.showwarning("警告", "需要至少两个显示器才能使用复制模式")
                 return
             
-            # 首先恢复所有被熄屏的显示器
+            # 首先恢复所有被熄屏的显示器（恢复操作同步完成，无需等待）
             self.restore_all_screens()
             
-            # 等待系统处理恢复操作
-            import time
-            time.sleep(0.5)
-            
             # 重新获取显示器信息
-            self.monitors = self.get_screen_info()
+            self.monitors = self.cached_screen_info()
             
-            # 获取主显示器信息
-            primary_monitor = None
-            for monitor in self.monitors:
-                if monitor['is_primary']:
-                    primary_monitor = monitor
-                    break
-            
-            if not primary_monitor:
+            # 将所有副显示器设置为与主显示器相同的位置和分辨率
+            layout = self.compute_duplicate_layout()
+            if layout is None:
                 messagebox.showerror("错误", "未找到主显示器")
                 return
+            self.apply_layout(layout)
             
-            # 将所有显示器设置为与主显示器相同的位置和分辨率
-            for monitor in self.monitors:
-                if not monitor['is_primary']:
-                    device_name = self.get_device_name_by_monitor(monitor)
-                    if device_name:
-                        try:
-                            current_settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
-                            new_settings = current_settings
-                            new_settings.Position_x = 0
-                            new_settings.Position_y = 0
-                            new_settings.PelsWidth = primary_monitor['width']
-                            new_settings.PelsHeight = primary_monitor['height']
-                            new_settings.Fields = win32con.DM_POSITION | win32con.DM_PELSWIDTH | win32con.DM_PELSHEIGHT
-                            
-                            result = win32api.ChangeDisplaySettingsEx(device_name, new_settings, 0)
-                        except Exception:
-                            pass
-            
-            # 刷新屏幕信息
-            self.root.after(1000, self.refresh_screens)
+            # 系统通知显示设置变化后刷新屏幕信息
+            self.schedule_display_refresh()
             
         except Exception as e:
             messagebox.showerror("错误", f"API切换复制模式失败: {str(e)}")
@@ -1015,81 +1436,17 @@ class ScreenController:
                 messagebox.showwarning("警告", "需要至少两个显示器才能使用扩展模式")
                 return
             
-            # 首先恢复所有被熄屏的显示器
+            # 首先恢复所有被熄屏的显示器（恢复操作同步完成，无需等待）
             self.restore_all_screens()
             
-            # 等待系统处理恢复操作
-            import time
-            time.sleep(0.5)
-            
             # 重新获取显示器信息，确保使用最新状态
-            self.monitors = self.get_screen_info()
+            self.monitors = self.cached_screen_info()
             
-            # 重新排列显示器位置以实现扩展模式
-            x_offset = 0
-            primary_width = 0
-            
-            # 首先处理主显示器
-            for monitor in self.monitors:
-                if monitor['is_primary']:
-                    device_name = self.get_device_name_by_monitor(monitor)
-                    if device_name:
-                        try:
-                            current_settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
-                            new_settings = current_settings
-                            
-                            # 确保主显示器有正确的分辨率和位置
-                            if hasattr(self, 'original_settings') and device_name in self.original_settings:
-                                original = self.original_settings[device_name]
-                                new_settings.PelsWidth = original['width']
-                                new_settings.PelsHeight = original['height']
-                                primary_width = original['width']
-                            else:
-                                new_settings.PelsWidth = monitor['width']
-                                new_settings.PelsHeight = monitor['height']
-                                primary_width = monitor['width']
-                            
-                            new_settings.Position_x = 0
-                            new_settings.Position_y = 0
-                            new_settings.Fields = win32con.DM_POSITION | win32con.DM_PELSWIDTH | win32con.DM_PELSHEIGHT
-                            
-                            result = win32api.ChangeDisplaySettingsEx(device_name, new_settings, 0)
-                        except Exception:
-                            pass
-                    break
-            
-            # 然后处理副显示器
-            x_offset = primary_width
-            for monitor in self.monitors:
-                if not monitor['is_primary']:
-                    device_name = self.get_device_name_by_monitor(monitor)
-                    if device_name:
-                        try:
-                            current_settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
-                            new_settings = current_settings
-                            
-                            # 确保副显示器有正确的分辨率
-                            if hasattr(self, 'original_settings') and device_name in self.original_settings:
-                                original = self.original_settings[device_name]
-                                new_settings.PelsWidth = original['width']
-                                new_settings.PelsHeight = original['height']
-                            else:
-                                new_settings.PelsWidth = monitor['width']
-                                new_settings.PelsHeight = monitor['height']
-                            
-                            # 副显示器放在主显示器右侧
-                            new_settings.Position_x = x_offset
-                            new_settings.Position_y = 0
-                            new_settings.Fields = win32con.DM_POSITION | win32con.DM_PELSWIDTH | win32con.DM_PELSHEIGHT
-                            
-                            result = win32api.ChangeDisplaySettingsEx(device_name, new_settings, 0)
-                            if result == win32con.DISP_CHANGE_SUCCESSFUL:
-                                x_offset += new_settings.PelsWidth
-                        except Exception:
-                            pass
+            # 主显示器放在原点，副显示器依次排列在右侧
+            self.apply_layout(self.compute_extend_layout())
             
-            # 刷新屏幕信息
-            self.root.after(1000, self.refresh_screens)
+            # 系统通知显示设置变化后刷新屏幕信息
+            self.schedule_display_refresh()
             
         except Exception as e:
             messagebox.showerror("错误", f"API切换扩展模式失败: {str(e)}")
@@ -1101,107 +1458,76 @@ class ScreenController:
         try:
             # 使用强制刷新显示器的方法，这不会改变显示器的排列
             if self.force_refresh_displays():
-                # 等待系统处理
-                import time
-                time.sleep(1.0)
-                
                 # 清空原始设置，因为已经通过刷新恢复了
-                if hasattr(self, 'original_settings'):
-                    self.original_settings.clear()
+                self.original_settings.clear()
+                self.monitor_off.clear()
                 
-                # 刷新屏幕信息以更新UI
-                self.refresh_screens()
+                # 系统通知显示设置变化后刷新屏幕信息，不阻塞界面等待
+                self.schedule_display_refresh()
                 
         except Exception:
             pass
     
-    def start_auto_screen_timer(self):
-        """启动自动熄屏检测定时器"""
-        def timer_loop():
-            while self.auto_screen_timer_running:
-                try:
-                    self.check_auto_screen_off()
-                    time.sleep(self.detection_interval)  # 使用配置的检测间隔
-                except Exception:
-                    time.sleep(self.detection_interval)
-        
-        timer_thread = threading.Thread(target=timer_loop, daemon=True)
-        timer_thread.start()
+    def schedule_auto_check(self, widget_info, delay_ms=0):
+        """为单个屏幕安排下一次自动熄屏检测，已有的检测定时器会被取消"""
+        self.cancel_auto_check(widget_info)
+        if widget_info['auto_enabled']:
+            widget_info['auto_timer'] = self.root.after(delay_ms, self.apply_auto_state, widget_info)
     
-    def check_auto_screen_off(self):
-        """检测并执行自动熄屏逻辑"""
+    def cancel_auto_check(self, widget_info):
+        """取消屏幕的自动熄屏检测定时器"""
+        if widget_info['auto_timer']:
+            self.root.after_cancel(widget_info['auto_timer'])
+            widget_info['auto_timer'] = None
+    
+    def apply_auto_state(self, widget_info):
+        """按熄屏时间范围执行自动熄屏或开启，并安排下一次检测
+        
+        下一次检测安排在最近的时间范围边界，边界之间仍按检测间隔复查屏幕状态
+        """
+        widget_info['auto_timer'] = None
+        if not widget_info['auto_enabled']:
+            return
+        
+        # 获取设置的时间范围，并转换为秒数进行比较
+        start_total_sec = self.parse_time_seconds(widget_info['start_time_var'].get())
+        end_total_sec = self.parse_time_seconds(widget_info['end_time_var'].get())
+        if start_total_sec is None or end_total_sec is None:
+            return
+        
+        current_time = datetime.now()
+        current_total_sec = current_time.hour * 3600 + current_time.minute * 60 + current_time.second
+        
+        # 判断是否在熄屏时间范围内
+        if start_total_sec <= end_total_sec:
+            # 同一天内的时间范围
+            in_sleep_time = start_total_sec <= current_total_sec <= end_total_sec
+        else:
+            # 跨天的时间范围（如18:00到次日07:00）
+            in_sleep_time = current_total_sec >= start_total_sec or current_total_sec <= end_total_sec
+        
+        monitor = widget_info['monitor']
         try:
-            from datetime import datetime
-            
-            # 检查preview_widgets是否存在
-            if not hasattr(self, 'preview_widgets') or not self.preview_widgets:
-                return
-            
-            current_time = datetime.now()
-            current_hour = current_time.hour
-            current_min = current_time.minute
-            current_sec = current_time.second
-            
-            for widget_info in self.preview_widgets:
-                try:
-                    # 检查widget_info是否有效
-                    if not isinstance(widget_info, dict) or not widget_info.get('auto_enabled', False):
-                        continue
-                    
-                    # 安全地获取时间设置变量
-                    start_hour_var = widget_info.get('start_hour_var')
-                    start_min_var = widget_info.get('start_min_var')
-                    start_sec_var = widget_info.get('start_sec_var')
-                    end_hour_var = widget_info.get('end_hour_var')
-                    end_min_var = widget_info.get('end_min_var')
-                    end_sec_var = widget_info.get('end_sec_var')
-                    
-                    # 检查所有变量是否存在
-                    if not all([start_hour_var, start_min_var, start_sec_var, end_hour_var, end_min_var, end_sec_var]):
-                        continue
-                    
-                    # 获取设置的时间范围
-                    start_hour = int(start_hour_var.get())
-                    start_min = int(start_min_var.get())
-                    start_sec = int(start_sec_var.get())
-                    end_hour = int(end_hour_var.get())
-                    end_min = int(end_min_var.get())
-                    end_sec = int(end_sec_var.get())
-                    
-                    # 转换为秒数进行比较
-                    current_total_sec = current_hour * 3600 + current_min * 60 + current_sec
-                    start_total_sec = start_hour * 3600 + start_min * 60 + start_sec
-                    end_total_sec = end_hour * 3600 + end_min * 60 + end_sec
-                    
-                    # 判断是否在熄屏时间范围内
-                    in_sleep_time = False
-                    if start_total_sec <= end_total_sec:
-                        # 同一天内的时间范围
-                        in_sleep_time = start_total_sec <= current_total_sec <= end_total_sec
-                    else:
-                        # 跨天的时间范围（如18:00到次日07:00）
-                        in_sleep_time = current_total_sec >= start_total_sec or current_total_sec <= end_total_sec
-                    
-                    monitor = widget_info.get('monitor')
-                    if not monitor:
-                        continue
-                    
-                    if in_sleep_time:
-                        # 在熄屏时间范围内，检测屏幕是否已熄屏，如果没有则熄屏
-                        if self.is_monitor_on(monitor):
-                            self.turn_off_screen(monitor)
-                    else:
-                        # 不在熄屏时间范围内，检测屏幕是否熄屏，如果熄屏则开启
-                        if not self.is_monitor_on(monitor):
-                            self.reset_displays()
-                            
-                except Exception:
-                    # 单个显示器检测失败时继续处理其他显示器
-                    continue
-                    
+            if in_sleep_time:
+                # 在熄屏时间范围内，检测屏幕是否已熄屏，如果没有则熄屏
+                if self.is_monitor_on(monitor):
+                    self.turn_off_screen(monitor)
+            else:
+                # 不在熄屏时间范围内，检测屏幕是否熄屏，如果熄屏则开启
+                if not self.is_monitor_on(monitor):
+                    self.reset_displays()
         except Exception:
-            # 整个检测过程失败时静默处理
             pass
+        
+        # 重置显示器会刷新屏幕区域，屏幕区域已被移除时不再继续检测
+        if self.widget_by_slot.get(widget_info['slot_key']) is not widget_info:
+            return
+        
+        # 距离下一个时间范围边界（开始时间或结束时间之后一秒）的秒数
+        next_edge_sec = min((start_total_sec - current_total_sec) % 86400 or 86400,
+                            (end_total_sec + 1 - current_total_sec) % 86400 or 86400)
+        delay_ms = min(next_edge_sec, self.detection_interval) * 1000 - current_time.microsecond // 1000
+        self.schedule_auto_check(widget_info, max(1, delay_ms))
     
     def is_monitor_on(self, monitor):
         """检测显示器是否开启"""
@@ -1212,12 +1538,16 @@ class ScreenController:
                 return True  # 如果无法获取设备名称，默认认为是开启的
             
             # 检查是否有保存的原始设置（表示该显示器被熄屏了）
-            if hasattr(self, 'original_settings') and device_name in self.original_settings:
+            if device_name in self.original_settings:
                 return False  # 如果有原始设置记录，说明显示器被熄屏了
             
+            # 熄屏状态以original_settings为准，默认不再查询当前显示设置
+            if not self.verify_monitor_power:
+                return True
+            
             # 尝试获取当前显示设置来判断显示器状态
             try:
-                current_settings = win32api.EnumDisplaySettings(device_name, win32con.ENUM_CURRENT_SETTINGS)
+                current_settings = self.get_current_display_settings(device_name)
                 # 如果能成功获取设置且分辨率不为0，说明显示器是开启的
                 return current_settings.PelsWidth > 0 and current_settings.PelsHeight > 0
             except Exception:
@@ -1227,72 +1557,60 @@ class ScreenController:
         except Exception:
             return True  # 出错时默认认为是开启的
     
-    def toggle_auto_screen_off(self, monitor):
+    def toggle_auto_screen_off(self, widget_info):
         """切换自动熄屏状态"""
         try:
-            # 找到对应的widget信息
-            widget_info = None
-            for widget in self.preview_widgets:
-                if widget['monitor'] == monitor:
-                    widget_info = widget
-                    break
-            
-            if not widget_info:
-                return
-            
             # 切换自动熄屏状态
             widget_info['auto_enabled'] = not widget_info['auto_enabled']
             
+            # 规范时间格式，无效输入恢复为已保存的时间
+            self.normalize_time_input(widget_info, 'start_time')
+            self.normalize_time_input(widget_info, 'end_time')
+            
             # 更新状态显示和时间输入框状态
             if widget_info['auto_enabled']:
                 widget_info['auto_status_label'].config(text="启用", fg="green")
                 # 启用自动熄屏时，禁用时间输入框
-                widget_info['start_hour_spinbox'].config(state="disabled")
-                widget_info['start_min_spinbox'].config(state="disabled")
-                widget_info['start_sec_spinbox'].config(state="disabled")
-                widget_info['end_hour_spinbox'].config(state="disabled")
-                widget_info['end_min_spinbox'].config(state="disabled")
-                widget_info['end_sec_spinbox'].config(state="disabled")
-                start_time = f"{widget_info['start_hour_var'].get()}:{widget_info['start_min_var'].get()}:{widget_info['start_sec_var'].get()}"
-                end_time = f"{widget_info['end_hour_var'].get()}:{widget_info['end_min_var'].get()}:{widget_info['end_sec_var'].get()}"
+                widget_info['start_time_entry'].config(state="disabled")
+                widget_info['end_time_entry'].config(state="disabled")
             else:
                 widget_info['auto_status_label'].config(text="禁用", fg="red")
                 # 禁用自动熄屏时，启用时间输入框
-                widget_info['start_hour_spinbox'].config(state="normal")
-                widget_info['start_min_spinbox'].config(state="normal")
-                widget_info['start_sec_spinbox'].config(state="normal")
-                widget_info['end_hour_spinbox'].config(state="normal")
-                widget_info['end_min_spinbox'].config(state="normal")
-                widget_info['end_sec_spinbox'].config(state="normal")
-                start_time = f"{widget_info['start_hour_var'].get()}:{widget_info['start_min_var'].get()}:{widget_info['start_sec_var'].get()}"
-                end_time = f"{widget_info['end_hour_var'].get()}:{widget_info['end_min_var'].get()}:{widget_info['end_sec_var'].get()}"
+                widget_info['start_time_entry'].config(state="normal")
+                widget_info['end_time_entry'].config(state="normal")
+            
+            start_time = widget_info['start_time_var'].get()
+            end_time = widget_info['end_time_var'].get()
             
             # 保存配置到INI文件
-            self.save_monitor_config(monitor, widget_info['auto_enabled'], start_time, end_time)
+            self.save_monitor_config(widget_info['monitor'], widget_info['auto_enabled'], start_time, end_time)
+            
+            # 启用时立即检测一次，禁用时取消检测定时器
+            self.schedule_auto_check(widget_info)
                 
         except Exception:
             pass
     
     def refresh_screens(self):
         """刷新屏幕信息"""
-        # 停止预览更新线程
-        self.preview_running = False
-        if hasattr(self, 'preview_thread') and self.preview_thread.is_alive():
-            self.preview_thread.join(timeout=2)
-        
-        # 清空预览组件列表，防止线程访问已销毁的组件
-        self.preview_widgets.clear()
-        
-        self.monitors = self.get_screen_info()
-        # 重新创建界面
-        for widget in self.root.winfo_children():
-            widget.destroy()
-        self.create_widgets()
+        # 停止预览更新，释放截图资源并丢弃旧的预览帧
+        self.stop_previews()
+        self.release_capture_surfaces()
+        
+        # 写入尚未保存的配置，避免被移除的屏幕丢失修改
+        if self.config_flush_id:
+            self.root.after_cancel(self.config_flush_id)
+            self.flush_config_dirty()
         
-        # 重新启动预览更新线程
-        self.preview_running = True
-        self.preview_thread = threading.Thread(target=self.update_previews, daemon=True)
-        self.preview_thread.start()
+        # 重新读取EDID和显示设备，以识别新接入的显示器
+        self.edid_cache = None
+        self.invalidate_display_caches()
+        self.monitors = self.cached_screen_info()
+        # 只更新发生变化的屏幕区域
+        self.update_preview_slots()
+        
+        # 重新启动预览更新
+        self.start_previews()
     
     def run(self):
         """启动应用程序"""
@@ -1303,70 +1621,139 @@ class ScreenController:
             messagebox.showerror("错误", f"程序运行错误: {str(e)}")
     
     def setup_global_hotkeys(self):
-        """设置全局快捷键"""
+        """设置全局快捷键和显示设置变化监听"""
+        # 使用系统热键表注册快捷键，不安装全局键盘钩子
+        # Tk的消息循环会丢弃线程消息，因此在独立线程中接收WM_HOTKEY
+        # 同一线程中的隐藏窗口接收广播的WM_DISPLAYCHANGE
+        self.hotkey_thread_id = None
+        self.hotkey_thread = threading.Thread(target=self.hotkey_message_loop, daemon=True)
+        self.hotkey_thread.start()
+    
+    def hotkey_message_loop(self):
+        """注册CTRL+ALT+X快捷键，处理WM_HOTKEY和WM_DISPLAYCHANGE消息"""
+        hotkey_id = 1
+        self.hotkey_thread_id = win32api.GetCurrentThreadId()
+        
+        # 创建隐藏的顶层窗口接收WM_DISPLAYCHANGE（仅消息窗口收不到广播消息）
+        notify_hwnd = None
         try:
-            # 注册CTRL+ALT+X快捷键
-            keyboard.add_hotkey('ctrl+alt+x', self.hotkey_reset_displays)
+            window_class = win32gui.WNDCLASS()
+            window_class.lpfnWndProc = {win32con.WM_DISPLAYCHANGE: self.on_wm_displaychange}
+            window_class.lpszClassName = "ControlEyeDisplayNotify"
+            window_class.hInstance = win32api.GetModuleHandle(None)
+            class_atom = win32gui.RegisterClass(window_class)
+            notify_hwnd = win32gui.CreateWindow(class_atom, "ControlEyeDisplayNotify", 0,
+                                                0, 0, 0, 0, 0, 0, window_class.hInstance, None)
+        except Exception as e:
+            print(f"监听显示设置变化失败: {str(e)}")
+        
+        hotkey_registered = False
+        try:
+            if not ctypes.windll.user32.RegisterHotKey(None, hotkey_id, win32con.MOD_CONTROL | win32con.MOD_ALT, ord('X')):
+                raise ctypes.WinError()
+            hotkey_registered = True
         except Exception as e:
             print(f"注册全局快捷键失败: {str(e)}")
+        
+        if not hotkey_registered and not notify_hwnd:
+            return
+        
+        try:
+            while True:
+                result, msg = win32gui.GetMessage(None, 0, 0)
+                # 收到WM_QUIT或出错时退出
+                if result <= 0:
+                    break
+                if msg[1] == win32con.WM_HOTKEY and msg[2] == hotkey_id:
+                    self.hotkey_reset_displays()
+                else:
+                    win32gui.TranslateMessage(msg)
+                    win32gui.DispatchMessage(msg)
+        finally:
+            if hotkey_registered:
+                ctypes.windll.user32.UnregisterHotKey(None, hotkey_id)
+            if notify_hwnd:
+                win32gui.DestroyWindow(notify_hwnd)
+    
+    def on_wm_displaychange(self, hwnd, msg, wparam, lparam):
+        """WM_DISPLAYCHANGE处理（在快捷键线程中执行），通知等待中的模式切换和主线程"""
+        # 广播消息处理期间主线程可能正在切换显示设置，这里不能调用Tk，只设置标志由主线程轮询
+        self.display_changed.set()
+        self.display_change_pending.set()
+        return 0
     
     def hotkey_reset_displays(self):
-        """快捷键触发的重置显示器方法"""
-        try:
-            # 在主线程中执行重置显示器操作
-            self.root.after(0, self.reset_displays)
-        except Exception as e:
-            print(f"快捷键重置显示器失败: {str(e)}")
+        """快捷键触发的重置显示器方法（在快捷键线程中执行）"""
+        # 主线程可能正在切换显示设置并等待本线程处理广播消息，这里不能调用Tk，只设置标志由主线程轮询
+        self.hotkey_reset_pending.set()
+    
+    def poll_thread_messages(self):
+        """在主线程中处理快捷键线程收到的快捷键和显示设置变化通知"""
+        self.message_poll_id = self.root.after(100, self.poll_thread_messages)
+        
+        if self.display_change_pending.is_set():
+            self.display_change_pending.clear()
+            self.on_display_change()
+        
+        if self.hotkey_reset_pending.is_set():
+            self.hotkey_reset_pending.clear()
+            self.reset_displays()
     
     def on_closing(self):
         """程序关闭时的清理工作"""
-        self.preview_running = False
-        self.auto_screen_timer_running = False
+        # 写入尚未保存的配置
+        if self.config_flush_id:
+            self.root.after_cancel(self.config_flush_id)
+            self.flush_config_dirty()
         # 清理全局快捷键
         try:
-            keyboard.unhook_all_hotkeys()
+            if self.hotkey_thread_id:
+                win32api.PostThreadMessage(self.hotkey_thread_id, win32con.WM_QUIT, 0, 0)
         except:
             pass
+        # 停止通知处理和预览显示，并释放截图资源
+        try:
+            self.root.after_cancel(self.message_poll_id)
+            self.root.after_cancel(self.preview_drain_id)
+        except Exception:
+            pass
+        self.stop_previews()
+        self.release_capture_surfaces()
         self.root.destroy()
 
-# 全局变量保存socket对象
-_single_instance_socket = None
+# 全局变量保存单实例互斥体句柄
+_single_instance_mutex = None
 
 def check_single_instance():
     """检查是否已有程序实例在运行"""
-    import socket
-    import atexit
-    global _single_instance_socket
+    global _single_instance_mutex
     
-    # 使用特定端口作为单实例标识
-    SINGLE_INSTANCE_PORT = 19876
+    # 使用命名互斥体作为单实例标识
+    SINGLE_INSTANCE_MUTEX_NAME = 'Global\\ControlEye_SingleInstance_v1'
     
     try:
-        # 创建socket并绑定端口
-        _single_instance_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        _single_instance_socket.bind(('127.0.0.1', SINGLE_INSTANCE_PORT))
-        _single_instance_socket.listen(1)
-        
-        # 注册退出时清理socket
-        def cleanup_socket():
-            global _single_instance_socket
-            if _single_instance_socket:
+        # 创建命名互斥体，已存在时说明已有实例运行
+        _single_instance_mutex = win32event.CreateMutex(None, False, SINGLE_INSTANCE_MUTEX_NAME)
+        if win32api.GetLastError() == winerror.ERROR_ALREADY_EXISTS:
+            print("检测到已有程序实例运行，正在激活现有窗口...")
+            activate_existing_window()
+            return False
+        
+        # 注册退出时释放互斥体
+        def cleanup_mutex():
+            global _single_instance_mutex
+            if _single_instance_mutex:
                 try:
-                    _single_instance_socket.close()
+                    win32api.CloseHandle(_single_instance_mutex)
                 except:
                     pass
-                _single_instance_socket = None
+                _single_instance_mutex = None
         
-        atexit.register(cleanup_socket)
+        atexit.register(cleanup_mutex)
         
         print("单实例检查通过，程序正常启动")
         return True
         
-    except OSError:
-        # 端口已被占用，说明已有实例运行
-        print("检测到已有程序实例运行，正在激活现有窗口...")
-        activate_existing_window()
-        return False
     except Exception as e:
         print(f"单实例检查出现异常: {e}")
         # 如果检查失败，允许程序继续运行
@@ -1375,20 +1762,23 @@ def check_single_instance():
 def activate_existing_window():
     """激活已存在的程序窗口"""
     try:
-        # 尝试使用pywin32激活窗口
-        import win32gui
-        import win32con
-        
-        def enum_windows_callback(hwnd, windows):
-            if win32gui.IsWindowVisible(hwnd):
-                window_text = win32gui.GetWindowText(hwnd)
-                if "老绅控屏眼" in window_text:
-                    windows.append(hwnd)
-            return True
+        # 按完整窗口标题直接查找（pywin32在找不到窗口时抛出异常）
+        try:
+            hwnd = win32gui.FindWindow(None, WINDOW_TITLE)
+        except pywintypes.error:
+            hwnd = 0
+        windows = [hwnd] if hwnd else []
         
-        # 查找所有窗口
-        windows = []
-        win32gui.EnumWindows(enum_windows_callback, windows)
+        # 标题不完全一致时枚举所有窗口查找
+        if not windows:
+            def enum_windows_callback(hwnd, windows):
+                if win32gui.IsWindowVisible(hwnd):
+                    window_text = win32gui.GetWindowText(hwnd)
+                    if "老绅控屏眼" in window_text:
+                        windows.append(hwnd)
+                return True
+            
+            win32gui.EnumWindows(enum_windows_callback, windows)
         
         # 激活找到的窗口
         for hwnd in windows:
@@ -1400,9 +1790,6 @@ def activate_existing_window():
             
         print("已尝试激活现有窗口")
         
-    except ImportError:
-        # pywin32不可用时的备用方案
-        print("pywin32不可用，无法激活现有窗口")
     except Exception as e:
         print(f"激活窗口时出现异常: {e}")
 